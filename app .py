@@ -1,77 +1,75 @@
+import functools
 import io
 import json
 import os
 import re
-from typing import Dict, Any, Tuple, List, Optional
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, Any, Iterable, Tuple, List, Optional
 
 import streamlit as st
 
+# Pages are OCR'd in parallel threads; keep each Tesseract process single-threaded
+# so its OpenMP workers don't oversubscribe the CPU.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 # ---------------------- Extraction helpers ----------------------
 
+# 200 DPI has ~2.25x fewer pixels than 300 and is plenty for resume-sized type.
+OCR_DPI = 200
+# Tesseract is known to hang on very long image file lists.
+OCR_BATCH_SIZE = 50
+# Each tesserocr worker loads its own model, so give every API at least this
+# many pages; a typical 1-3 page resume then loads the model once.
+TESSEROCR_MIN_PAGES_PER_API = 4
+
+def _write_pages(buf: io.StringIO, pages: Iterable[str]) -> None:
+    # Stream page texts into one buffer rather than collecting a list to join.
+    for text in pages:
+        if text:
+            buf.write(text)
+            buf.write("\n")
+
+@st.cache_data(show_spinner=False, max_entries=32)
 def extract_text_pdfplumber(file_bytes: bytes) -> str:
     try:
         import pdfplumber
     except Exception:
         return ""
-    text_pages = []
+    buf = io.StringIO()
     try:
         with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
-            for page in pdf.pages:
-                txt = page.extract_text() or ""
-                text_pages.append(txt.strip())
+            _write_pages(buf, ((page.extract_text() or "").strip() for page in pdf.pages))
     except Exception:
         return ""
-    text = "\n".join(p for p in text_pages if p)
-    return text.strip()
+    return buf.getvalue().strip()
 
-def extract_text_ocr_pdf2image(file_bytes: bytes) -> str:
-    try:
-        from pdf2image import convert_from_bytes
-        import pytesseract
-    except Exception:
-        return ""
-    try:
-        images = convert_from_bytes(file_bytes, dpi=300)
-    except Exception:
-        return ""
-    ocr_texts = []
-    for img in images:
-        try:
-            ocr_texts.append(pytesseract.image_to_string(img))
-        except Exception:
-            continue
-    return "\n".join(ocr_texts).strip()
-
-def extract_text_ocr_pymupdf(file_bytes: bytes) -> str:
+@st.cache_data(show_spinner=False, max_entries=32)
+def extract_text_pymupdf(file_bytes: bytes) -> str:
     try:
         import fitz  # PyMuPDF
-        import pytesseract
-        from PIL import Image
     except Exception:
         return ""
+    buf = io.StringIO()
     try:
-        doc = fitz.open(stream=file_bytes, filetype="pdf")
+        with fitz.open(stream=file_bytes, filetype="pdf") as doc:
+            _write_pages(buf, (page.get_text("text").strip() for page in doc))
     except Exception:
         return ""
-    texts = []
-    for page in doc:
-        try:
-            pix = page.get_pixmap(dpi=300, alpha=False)
-            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            texts.append(pytesseract.image_to_string(img))
-        except Exception:
-            continue
-    return "\n".join(texts).strip()
+    return buf.getvalue().strip()
 
-def extract_text(file_bytes: bytes, ocr_mode: str = "auto") -> Tuple[str, str, Dict[str, bool]]:
+@functools.lru_cache(maxsize=1)
+def _probe_deps() -> Dict[str, bool]:
+    # Failed imports aren't cached by Python, so probe once per process.
     diags = {
         "has_pdfplumber": False,
         "has_pdf2image": False,
         "has_pymupdf": False,
         "has_pytesseract": False,
+        "has_tesserocr": False,
     }
 
-    # Check imports for diagnostics only (do not fail here)
     try:
         import pdfplumber  # noqa
         diags["has_pdfplumber"] = True
@@ -92,8 +90,146 @@ def extract_text(file_bytes: bytes, ocr_mode: str = "auto") -> Tuple[str, str, D
         diags["has_pytesseract"] = True
     except Exception:
         pass
+    try:
+        import tesserocr  # noqa
+        diags["has_tesserocr"] = True
+    except Exception:
+        pass
+    return diags
+
+def _tesseract_bindings() -> Optional[str]:
+    deps = _probe_deps()
+    if deps["has_tesserocr"]:
+        return "tesserocr"
+    if deps["has_pytesseract"]:
+        return "pytesseract"
+    return None
+
+def _ocr_batch_tesserocr(tmp_dir: str, start: int, images: List[Any]) -> List[str]:
+    from tesserocr import PyTessBaseAPI
+    from PIL import ImageOps
+    try:
+        api = PyTessBaseAPI()
+    except Exception:
+        # e.g. tesserocr is installed but can't find its tessdata
+        if _probe_deps()["has_pytesseract"]:
+            return _ocr_batch_pytesseract(tmp_dir, start, images)
+        return []
+    texts = []
+    # One API per worker keeps the language model loaded across pages.
+    with api:
+        for img in images:
+            try:
+                api.SetImage(ImageOps.autocontrast(img))
+                texts.append(api.GetUTF8Text())
+            except Exception:
+                continue
+    return [t for t in texts if t.strip()]
+
+def _ocr_batch_pytesseract(tmp_dir: str, start: int, images: List[Any]) -> List[str]:
+    import pytesseract
+    from PIL import ImageOps
+    paths = []
+    for i, img in enumerate(images, start):
+        # Uncompressed PNM keeps the temp-file round trip cheap.
+        path = os.path.join(tmp_dir, f"page{i:05d}.pnm")
+        try:
+            ImageOps.autocontrast(img).save(path)
+        except Exception:
+            continue
+        paths.append(path)
+    if not paths:
+        return []
+    # One Tesseract process per file list. ocr_images sizes batches per core,
+    # so lists only hold several pages when there are more pages than cores;
+    # shorter documents still start one process per page to OCR in parallel.
+    list_path = os.path.join(tmp_dir, f"batch{start:05d}.txt")
+    with open(list_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(paths) + "\n")
+    try:
+        out = pytesseract.image_to_string(list_path)
+    except Exception:
+        return []
+    return [t for t in out.split("\f") if t.strip()]
+
+def ocr_images(images: List[Any]) -> str:
+    # Both bindings release the GIL while Tesseract runs, so batches run in
+    # parallel threads.
+    if not images:
+        return ""
+    bindings = _tesseract_bindings()
+    if bindings is None:
+        return ""
+    workers = min(len(images), os.cpu_count() or 1)
+    if bindings == "tesserocr":
+        ocr_batch = _ocr_batch_tesserocr
+        workers = max(1, min(workers, len(images) // TESSEROCR_MIN_PAGES_PER_API))
+    else:
+        ocr_batch = _ocr_batch_pytesseract
+    size = min(OCR_BATCH_SIZE, -(-len(images) // workers))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = [
+                ex.submit(ocr_batch, tmp_dir, start, images[start:start + size])
+                for start in range(0, len(images), size)
+            ]
+            buf = io.StringIO()
+            for f in futures:
+                _write_pages(buf, f.result())
+    return buf.getvalue().strip()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def extract_text_ocr_pdf2image(file_bytes: bytes, dpi: int = OCR_DPI) -> str:
+    try:
+        from pdf2image import convert_from_bytes
+    except Exception:
+        return ""
+    if _tesseract_bindings() is None:
+        return ""
+    try:
+        images = convert_from_bytes(file_bytes, dpi=dpi, grayscale=True)
+    except Exception:
+        return ""
+    try:
+        return ocr_images(images)
+    except Exception:
+        return ""
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def extract_text_ocr_pymupdf(file_bytes: bytes, dpi: int = OCR_DPI) -> str:
+    try:
+        import fitz  # PyMuPDF
+        from PIL import Image
+    except Exception:
+        return ""
+    if _tesseract_bindings() is None:
+        return ""
+    try:
+        doc = fitz.open(stream=file_bytes, filetype="pdf")
+    except Exception:
+        return ""
+    # Render serially (MuPDF documents aren't thread-safe), OCR in parallel.
+    images = []
+    with doc:
+        for page in doc:
+            try:
+                pix = page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY, alpha=False)
+                images.append(Image.frombytes("L", [pix.width, pix.height], pix.samples))
+            except Exception:
+                continue
+    try:
+        return ocr_images(images)
+    except Exception:
+        return ""
 
-    # 1) Try text-based extraction
+@st.cache_data(show_spinner=False, max_entries=32)
+def extract_text(file_bytes: bytes, ocr_mode: str = "auto") -> Tuple[str, str, Dict[str, bool]]:
+    diags = dict(_probe_deps())
+
+    # 1) Try text-based extraction: PyMuPDF's C extractor first, pdfplumber second
+    text = extract_text_pymupdf(file_bytes)
+    if text and len(text) >= 100:
+        return text, "pymupdf", diags
     text = extract_text_pdfplumber(file_bytes)
     if text and len(text) >= 100:
         return text, "pdfplumber", diags
@@ -128,10 +264,16 @@ def extract_text(file_bytes: bytes, ocr_mode: str = "auto") -> Tuple[str, str, D
 # ---------------------- Parsing helpers ----------------------
 
 EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
-PHONE_RE = re.compile(r"(?:\+?\d{1,2}\s*)?(?:\(?\d{3}\)?[\s\-\.]?\d{3}[\s\-\.]?\d{4})")
+# Every boundary str.splitlines() breaks on.
+_LINE_BREAKS = r"\n\r\v\f\x1c-\x1e\x85\u2028\u2029"
+# Any whitespace except line breaks (NBSP/thin spaces are common in PDF text),
+# so a number never spans two lines.
+_PHONE_SEP = rf"[^\S{_LINE_BREAKS}]"
+PHONE_RE = re.compile(rf"(?:\+?\d{{1,2}}{_PHONE_SEP}*)?(?:\(?\d{{3}}\)?(?:{_PHONE_SEP}|[\-\.])?\d{{3}}(?:{_PHONE_SEP}|[\-\.])?\d{{4}})")
 URL_RE = re.compile(r"(https?://[^\s]+|(?:www\.)?[A-Za-z0-9\-]+\.[A-Za-z]{2,}(?:/[^\s]*)?)")
-LINKEDIN_RE = re.compile(r"(?:https?://)?(?:www\.)?linkedin\.com/[A-Za-z0-9/_\-]+", re.I)
-GITHUB_RE = re.compile(r"(?:https?://)?(?:www\.)?github\.com/[A-Za-z0-9_\-]+", re.I)
+_GITHUB_PATH_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_-")
+_LINKEDIN_PATH_CHARS = _GITHUB_PATH_CHARS | {"/"}
+_LINE_RE = re.compile(rf"[^{_LINE_BREAKS}]+")
 
 
 DATE_WORDS = r"Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec|January|February|March|April|June|July|August|September|October|November|December|Present|Current|\\d{4}"
@@ -152,6 +294,22 @@ SECTION_TITLES = [
     "awards", "honors",
     "summary", "profile", "objective",
 ]
+_SECTION_TITLES_SET = frozenset(SECTION_TITLES)
+_EXPERIENCE_KEYS = ("experience", "work experience", "professional experience")
+_SKILLS_KEYS = ("skills", "technical skills", "skills & technologies")
+
+# One alternation over every title so find_sections scans the text once.
+_SECTION_ALT = re.compile(
+    r"(?im)^\\s*(" + "|".join(re.escape(t) for t in SECTION_TITLES) + r")\\s*:?\\s*$"
+)
+_HEADER_SPLIT_RE = re.compile(r"\\s+[—\\-–]\\s+|\\s+\\|\\s+")
+_ROLE_KW_RE = re.compile(r"engineer|manager|developer|scientist|consultant|intern|analyst|lead|architect", re.I)
+_DEGREE_KW_RE = re.compile(r"B\\.?S|B\\.?E|M\\.?S|M\\.?Eng|M\\.?Tech|B\\.?Tech|Ph\\.?D|Bachelor|Master|Doctor|Associate", re.I)
+_LOCATION_RE = re.compile(r"[A-Za-z]+,\\s*[A-Za-z]+")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[\\.\\!\\?])\\s+(?=[A-Z])")
+_SKILL_DELIM_TRANS = str.maketrans({",": "|", ";": "|", "\n": "|"})
+_PARAGRAPH_SPLIT_RE = re.compile(r"\\n\\s*\\n")
+_GPA_RE = re.compile(r"GPA\\s*[:\\-]?\\s*([0-9]\\.\\d{1,2})", re.I)
 
 def guess_name(lines: List[str], email_line_idx: int) -> str:
     candidates = []
@@ -160,7 +318,7 @@ def guess_name(lines: List[str], email_line_idx: int) -> str:
         if not clean:
             continue
         if clean.isupper() or clean.istitle():
-            if clean.lower() not in SECTION_TITLES:
+            if clean.lower() not in _SECTION_TITLES_SET:
                 candidates.append(clean)
     if candidates:
         return candidates[0]
@@ -169,44 +327,44 @@ def guess_name(lines: List[str], email_line_idx: int) -> str:
             return line.strip()
     return ""
 
-def extract_contact_info(text: str) -> Dict[str, Any]:
-    lines = [l for l in text.splitlines() if l.strip()]
-    joined = " | ".join(lines)
+def _profile_url(urls: List[str], host: str, path_chars: frozenset) -> Optional[str]:
+    # A bare "linkedin.com/" isn't a profile: require a path character after it.
+    for u in urls:
+        lower = u.lower()
+        i = lower.find(host)
+        while i != -1:
+            if lower[i + len(host):i + len(host) + 1] in path_chars:
+                return u
+            i = lower.find(host, i + 1)
+    return None
 
-    emails = EMAIL_RE.findall(joined)
-    phones = PHONE_RE.findall(joined)
-    urls = URL_RE.findall(joined)
+def extract_contact_info(text: str) -> Dict[str, Any]:
+    # guess_name only ever looks at the first few non-blank lines.
+    lines = list(islice((m.group(0) for m in _LINE_RE.finditer(text) if not m.group(0).isspace()), 5))
 
-    linkedin = [u for u in urls if LINKEDIN_RE.search(u)]
-    github = [u for u in urls if GITHUB_RE.search(u)]
+    email = EMAIL_RE.search(text)
+    phone = PHONE_RE.search(text)
+    urls = list(dict.fromkeys(URL_RE.findall(text)))
 
-    email_idx = 0
-    for idx, line in enumerate(lines[:15]):
-        if EMAIL_RE.search(line):
-            email_idx = idx
-            break
+    linkedin = _profile_url(urls, "linkedin.com/", _LINKEDIN_PATH_CHARS)
+    github = _profile_url(urls, "github.com/", _GITHUB_PATH_CHARS)
 
-    name = guess_name(lines, email_idx)
+    name = guess_name(lines, 0)
 
     return {
         "name": name or None,
-        "email": emails[0] if emails else None,
-        "phone": phones[0] if phones else None,
-        "urls": list(dict.fromkeys(urls)),
-        "linkedin": linkedin[0] if linkedin else None,
-        "github": github[0] if github else None,
+        "email": email.group(0) if email else None,
+        "phone": phone.group(0) if phone else None,
+        "urls": urls,
+        "linkedin": linkedin,
+        "github": github,
     }
 
 def find_sections(text: str) -> Dict[str, str]:
-    indices = []
-    for title in SECTION_TITLES:
-        pattern = re.compile(rf"(?m)^\\s*{re.escape(title)}\\s*:?\\s*$", re.I)
-        for match in pattern.finditer(text):
-            indices.append((match.start(), title))
+    indices = [(m.start(), m.group(1).lower()) for m in _SECTION_ALT.finditer(text)]
     if not indices:
         return {"body": text}
 
-    indices.sort()
     sections = {}
     for i, (start, title) in enumerate(indices):
         end = indices[i + 1][0] if i + 1 < len(indices) else len(text)
@@ -217,33 +375,43 @@ def find_sections(text: str) -> Dict[str, str]:
 def parse_bullets(block: str) -> List[str]:
     bullets = []
     for line in block.splitlines():
-        if BULLET_RE.match(line):
-            bullets.append(BULLET_RE.sub("", line).strip())
+        m = BULLET_RE.match(line)
+        if m:
+            bullets.append(line[m.end():].strip())
     if not bullets:
-        parts = re.split(r"(?<=[\\.\\!\\?])\\s+(?=[A-Z])", block.strip())
+        parts = _SENTENCE_SPLIT_RE.split(block.strip())
         bullets = [p.strip() for p in parts if len(p.strip()) > 0]
     return bullets
 
+def search_date_range(text: str) -> Optional[Any]:
+    # Every range needs a separator; skip the backtracking regex when there's none.
+    if "-" in text or "–" in text or "—" in text or "to" in text.lower():
+        return DATE_RANGE_RE.search(text)
+    return None
+
 def parse_experience(section_text: str) -> List[Dict[str, Any]]:
     lines = section_text.splitlines()
-    if lines and lines[0].strip().lower().startswith(("experience","work experience","professional experience")):
+    if lines and lines[0].strip().lower().startswith(_EXPERIENCE_KEYS):
         lines = lines[1:]
 
     experiences = []
     buffer: List[str] = []
+    # Entries start at a dated line, so the date match found while scanning
+    # lines is kept for the block instead of searching it again.
+    buffer_date = None
 
     def flush_buffer():
-        nonlocal buffer, experiences
+        nonlocal buffer, buffer_date, experiences
         block = "\\n".join(buffer).strip()
         if not block:
             return
         blines = [l for l in block.splitlines() if l.strip()]
         header = blines[0] if blines else ""
-        parts = re.split(r"\\s+[—\\-–]\\s+|\\s+\\|\\s+", header)
+        parts = _HEADER_SPLIT_RE.split(header)
         role, company = None, None
         if len(parts) == 2:
             left, right = parts
-            if re.search(r"engineer|manager|developer|scientist|consultant|intern|analyst|lead|architect", left, re.I):
+            if _ROLE_KW_RE.search(left):
                 role, company = left.strip(), right.strip()
             else:
                 company, role = left.strip(), right.strip()
@@ -254,12 +422,12 @@ def parse_experience(section_text: str) -> List[Dict[str, Any]]:
             else:
                 role = header.strip()
 
-        dr = DATE_RANGE_RE.search(block)
+        dr = buffer_date
         start_date, end_date = (dr.group(1), dr.group(2)) if dr else (None, None)
 
         location = None
         for l in blines[:3]:
-            if re.search(r"[A-Za-z]+,\\s*[A-Za-z]+", l) and not EMAIL_RE.search(l):
+            if _LOCATION_RE.search(l) and not EMAIL_RE.search(l):
                 location = l.strip()
                 break
 
@@ -273,10 +441,14 @@ def parse_experience(section_text: str) -> List[Dict[str, Any]]:
             "highlights": bullets
         })
         buffer = []
+        buffer_date = None
 
     for line in lines:
-        if DATE_RANGE_RE.search(line) and buffer:
+        dr = search_date_range(line)
+        if dr and buffer:
             flush_buffer()
+        if dr and buffer_date is None:
+            buffer_date = dr
         buffer.append(line)
     if buffer:
         flush_buffer()
@@ -288,17 +460,17 @@ def parse_education(section_text: str) -> List[Dict[str, Any]]:
         lines = lines[1:]
     entries = []
     block = "\\n".join(lines)
-    for chunk in re.split(r"\\n\\s*\\n", block):
+    for chunk in _PARAGRAPH_SPLIT_RE.split(block):
         clines = [c.strip() for c in chunk.splitlines() if c.strip()] or []
         if not clines:
             continue
         header = clines[0]
         degree = None
         institution = None
-        parts = re.split(r"\\s+[—\\-–]\\s+|\\s+\\|\\s+", header)
+        parts = _HEADER_SPLIT_RE.split(header)
         if len(parts) == 2:
             left, right = parts
-            if re.search(r"B\\.?S|B\\.?E|M\\.?S|M\\.?Eng|M\\.?Tech|B\\.?Tech|Ph\\.?D|Bachelor|Master|Doctor|Associate", left, re.I):
+            if _DEGREE_KW_RE.search(left):
                 degree, institution = left.strip(), right.strip()
             else:
                 institution, degree = left.strip(), right.strip()
@@ -309,11 +481,11 @@ def parse_education(section_text: str) -> List[Dict[str, Any]]:
             else:
                 institution = header
 
-        dr = DATE_RANGE_RE.search(chunk)
+        dr = search_date_range(chunk)
         start_date, end_date = (dr.group(1), dr.group(2)) if dr else (None, None)
 
         gpa = None
-        m = re.search(r"GPA\\s*[:\\-]?\\s*([0-9]\\.\\d{1,2})", chunk, re.I)
+        m = _GPA_RE.search(chunk)
         if m:
             gpa = m.group(1)
 
@@ -328,18 +500,16 @@ def parse_education(section_text: str) -> List[Dict[str, Any]]:
 
 def parse_skills(section_text: str) -> List[str]:
     lines = section_text.splitlines()
-    if lines and lines[0].strip().lower().startswith(("skills","technical skills","skills & technologies")):
-        section_text = "\\n".join(lines[1:])
-    parts = re.split(r"[,|;\\n]", section_text)
-    skills = [p.strip(" -•\\t") for p in parts if p.strip()]
-    seen = set()
-    dedup = []
+    if lines and lines[0].strip().lower().startswith(_SKILLS_KEYS):
+        section_text = "\n".join(lines[1:])
+    parts = section_text.translate(_SKILL_DELIM_TRANS).split("|")
+    skills = (p.strip(" -•\t") for p in parts)
+    # Case-insensitive de-dup that keeps the first spelling seen.
+    dedup: Dict[str, str] = {}
     for s in skills:
-        key = s.lower()
-        if key not in seen:
-            dedup.append(s)
-            seen.add(key)
-    return dedup
+        if s:
+            dedup.setdefault(s.lower(), s)
+    return list(dedup.values())
 
 def parse_projects(section_text: str) -> List[Dict[str, Any]]:
     lines = section_text.splitlines()
@@ -370,13 +540,13 @@ def parse_projects(section_text: str) -> List[Dict[str, Any]]:
 
 def parse_sections_to_json(sections: Dict[str, str]) -> Dict[str, Any]:
     data: Dict[str, Any] = {}
-    if any(k in sections for k in ("experience","work experience","professional experience")):
-        key = next((k for k in ("experience","work experience","professional experience") if k in sections), None)
+    key = next((k for k in _EXPERIENCE_KEYS if k in sections), None)
+    if key is not None:
         data["experience"] = parse_experience(sections[key])
     if "education" in sections:
         data["education"] = parse_education(sections["education"])
-    if any(k in sections for k in ("skills","technical skills","skills & technologies")):
-        key = next((k for k in ("skills","technical skills","skills & technologies") if k in sections), None)
+    key = next((k for k in _SKILLS_KEYS if k in sections), None)
+    if key is not None:
         data["skills"] = parse_skills(sections[key])
     if "projects" in sections:
         data["projects"] = parse_projects(sections["projects"])
@@ -385,6 +555,7 @@ def parse_sections_to_json(sections: Dict[str, str]) -> Dict[str, Any]:
             data[k.replace(" & ", "_and_").replace(" ", "_")] = sections[k]
     return data
 
+@st.cache_data(show_spinner=False, max_entries=32)
 def build_json(text: str, method: str) -> Dict[str, Any]:
     contact = extract_contact_info(text)
     sections = find_sections(text)
@@ -455,8 +626,9 @@ if uploaded and run_btn:
 st.markdown("---")
 st.markdown("**Notes**")
 st.markdown(
-    "- Text extraction uses `pdfplumber`; if the PDF is scanned, enable OCR fallback.\\n"
+    "- Text extraction uses `PyMuPDF` when installed, then `pdfplumber`; if the PDF is scanned, enable OCR fallback.\\n"
     "- OCR engines supported: `pdf2image + pytesseract` (needs **Poppler** + **Tesseract**) or `PyMuPDF + pytesseract` (no Poppler needed).\\n"
     "- Install on macOS with Homebrew: `brew install tesseract poppler` (for pdf2image path).\\n"
-    "- Or use PyMuPDF route (no Poppler): `pip install pymupdf pytesseract`. Still requires Tesseract installed."
+    "- Or use PyMuPDF route (no Poppler): `pip install pymupdf pytesseract`. Still requires Tesseract installed.\\n"
+    "- Optional: `pip install tesserocr` is used instead of `pytesseract` when available; it keeps the Tesseract model loaded between pages."
 )